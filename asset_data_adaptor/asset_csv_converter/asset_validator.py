@@ -5,9 +5,54 @@ If the data passes validation then return True. Therefore, the Asset object can
 after passing appropriate validation methods.
 """
 
-import re
+import functools
+import sys
 from datetime import datetime
 
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ddmonyyyy(date_string: str) -> datetime:
+    """Parses a 'dd-Mon-yyyy' date string, caching results as install dates repeat across a file.
+
+    Args:
+        date_string (str): The date string to be parsed.
+    Returns:
+        datetime: The parsed date.
+    Raises:
+        ValueError: If the date string is not a valid 'dd-Mon-yyyy' date.
+    """
+    # Fast path for the canonical format, falls back to strptime for anything else.
+    parts = date_string.split("-")
+    if len(parts) == 3:
+        day, month, year = parts
+        if (
+            month in _MONTHS
+            and 1 <= len(day) <= 2
+            and day.isdecimal()
+            and len(year) == 4
+            and year.isdecimal()
+        ):
+            try:
+                return datetime(int(year), _MONTHS[month], int(day))
+            except ValueError:
+                pass
+    return datetime.strptime(date_string, "%d-%b-%Y")
+
 
 class AssetValidator:
     """
@@ -30,6 +75,27 @@ class AssetValidator:
     }
     VALID_STATUS_VALUES = ["Active", "Proposed", "Inactive"]
     VALID_CELL_VALUES = ["NORT", "EAST", "CNTR", "WEST"]
+    # Hashed lookups for the per-record membership checks.
+    _VALID_ASSET_TYPE_SET = frozenset(VALID_ASSET_TYPES)
+    _VALID_STATUS_SET = frozenset(VALID_STATUS_VALUES)
+    _VALID_CELL_SET = frozenset(VALID_CELL_VALUES)
+    # CSV record positions of asset type, type description, cell and status.
+    _INTERNED_FIELDS = (1, 2, 7, 9)
+
+    # Fixed attribute layout, no per-instance __dict__.
+    __slots__ = (
+        "asset_id",
+        "asset_type",
+        "type_description",
+        "install_date",
+        "easting",
+        "northing",
+        "location",
+        "cell",
+        "signal_group",
+        "status",
+        "install_engineer",
+    )
 
     def __init__(
         self,
@@ -95,9 +161,13 @@ class AssetValidator:
         Raises:
             ValueError: If the asset ID is in an incorrect format or has an incorrect length.
         """
-        # Validate ID format using regex pattern
-        id_regex_pattern = r"^\d{2}/\d{6}$"
-        if not re.match(id_regex_pattern, asset_id):
+        # Validate ID format, 'dd/dddddd'. Fixed shape so checked by position rather than regex.
+        if not (
+            len(asset_id) == 9
+            and asset_id[2] == "/"
+            and asset_id[:2].isdecimal()
+            and asset_id[3:].isdecimal()
+        ):
             raise ValueError(
                 f"Invalid format for asset ID: '{asset_id}'. Please check."
             )
@@ -115,7 +185,7 @@ class AssetValidator:
             ValueError: If the type description does not match the corresponding asset type.
         """
         # Check asset type against valid values.
-        if asset_type not in AssetValidator.VALID_ASSET_TYPES.keys():
+        if asset_type not in AssetValidator._VALID_ASSET_TYPE_SET:
             raise ValueError(f"Invalid asset type value: '{asset_type}'. Please check.")
         # Confirm type description matches type and that it is an allowed value.
         if type_description != AssetValidator.VALID_ASSET_TYPES[asset_type]:
@@ -135,29 +205,31 @@ class AssetValidator:
         """
 
         # Check for invalid value
-        if status not in AssetValidator.VALID_STATUS_VALUES:
+        if status not in AssetValidator._VALID_STATUS_SET:
             raise ValueError(f"Status '{status}' is not a valid option")
         return True
 
     # TODO re-write docstring
     @staticmethod
-    def _validate_install_date(install_date: str, status: str) -> None:
+    def _validate_install_date(
+        install_date: str, status: str, ref_date: datetime = None
+    ) -> None:
         """Validates the installation date of the asset based on its status.
 
         Args:
             install_date (str): The installation date of the asset.
             status (str): The status of the asset.
+            ref_date (datetime, optional): The date future installs are checked against. Defaults to now.
         Raises:
             ValueError: If the date value is not in the following format 'dd-Mon-yyyy'.
             ValueError: If the install date is in the future for an active or inactive site.
         """
         # Reference date
-        ref_date = datetime.now()
+        if ref_date is None:
+            ref_date = datetime.now()
         # Parse the input install date using datetime.
         try:
-            install_date_obj = datetime.strptime(
-                install_date, "%d-%b-%Y"
-            )  # Regex could be used for tighter control if needed.
+            install_date_obj = _parse_ddmonyyyy(install_date)
         except ValueError:
             raise ValueError(
                 f"Install date '{install_date}' is in an invalid date format. Please ensure it is in 'dd-Mon-yyyy'"
@@ -189,8 +261,8 @@ class AssetValidator:
             int_easting = int(easting)
         except Exception as e:
             raise e
-        # Validate BNG range for northing
-        if max_easting > int_easting < min_easting:
+        # Validate BNG range for easting
+        if not (min_easting <= int_easting <= max_easting):
             raise ValueError(
                 f"Easting '{easting}' out of range for London Area. Please Check."
             )
@@ -216,7 +288,7 @@ class AssetValidator:
         except Exception as e:
             raise e
         # Validate BNG range for northing
-        if max_northing > int_northing < min_northing:
+        if not (min_northing <= int_northing <= max_northing):
             raise ValueError(
                 f"Northing '{northing}' out of range for London Area. Please Check."
             )
@@ -249,7 +321,7 @@ class AssetValidator:
         """
 
         # Check against valid Cell values.
-        if cell not in AssetValidator.VALID_CELL_VALUES:
+        if cell not in AssetValidator._VALID_CELL_SET:
             raise ValueError(f"Invalid value for Cell: '{cell}'. Please check")
         return True
 
@@ -263,9 +335,12 @@ class AssetValidator:
         Raises:
             ValueError: If the signal group information is outside the allowed format.
         """
-        # Validate Signal Group using regex pattern
-        signal_regex_pattern = r"^(G|R)\d+$"
-        if not re.match(signal_regex_pattern, signal_group):
+        # Validate Signal Group, 'G' or 'R' followed by digits.
+        if not (
+            len(signal_group) >= 2
+            and signal_group[0] in ("G", "R")
+            and signal_group[1:].isdecimal()
+        ):
             raise ValueError(
                 f"Invalid format for Signal Group: '{signal_group}'. Please check."
             )
@@ -285,13 +360,12 @@ class AssetValidator:
         return True
 
     @classmethod
-    def from_csv_record(cls, csv_record: tuple) -> "AssetValidator":
-        """Creates an Asset object from a CSV record.
+    def validate(cls, csv_record: tuple, ref_date: datetime = None) -> None:
+        """Validates a CSV record without creating an Asset object.
 
         Args:
             csv_record (tuple): A tuple containing asset data from a CSV record.
-        Returns:
-            AssetValidator: An AssetValidator object created from the CSV record.
+            ref_date (datetime, optional): The date future installs are checked against. Defaults to now.
         Raises:
             ValueError: If the CSV record contains invalid data.
         """
@@ -309,31 +383,51 @@ class AssetValidator:
             status,
             install_engineer,
         ) = csv_record
-        # Validate data fields here using the validation methods
-        cls._validate_asset_id(asset_id)
-        cls._validate_asset_type(asset_type, type_description)
+        # Validate data fields here using the validation methods.
+        # Ordered cheapest first so invalid records fail before the costlier checks.
         cls._validate_status(
             status
         )  # Status before date to ensure the status field is in the correct format.
-        cls._validate_install_date(install_date, status)
-        cls._validate_easting(easting)
-        cls._validate_northing(northing)
-        cls._validate_location(location)
         cls._validate_cell(cell)
-        cls._validate_signal_group(signal_group)
+        cls._validate_asset_type(asset_type, type_description)
         cls._validate_engineer(install_engineer)
-
+        cls._validate_location(location)
+        cls._validate_asset_id(asset_id)
+        cls._validate_signal_group(signal_group)
+        cls._validate_easting(easting)
+        cls._validate_northing(northing)
+        cls._validate_install_date(install_date, status, ref_date)  # Date parsing last.
         # Validate other fields similarly
-        return cls(
-            asset_id,
-            asset_type,
-            type_description,
-            install_date,
-            easting,
-            northing,
-            location,
-            cell,
-            signal_group,
-            status,
-            install_engineer,
-        )
+        return True
+
+    @staticmethod
+    def intern_fields(csv_record: tuple) -> list:
+        """Interns the asset type, type description, cell and status of a validated CSV record.
+        These take only a handful of values, so records then share one string per distinct value.
+
+        Args:
+            csv_record (tuple): A CSV record that has passed validation.
+        Returns:
+            list: A copy of the CSV record with those fields interned.
+        """
+        interned_record = list(csv_record)
+        for index in AssetValidator._INTERNED_FIELDS:
+            interned_record[index] = sys.intern(interned_record[index])
+        return interned_record
+
+    @classmethod
+    def from_csv_record(
+        cls, csv_record: tuple, ref_date: datetime = None
+    ) -> "AssetValidator":
+        """Creates an Asset object from a CSV record.
+
+        Args:
+            csv_record (tuple): A tuple containing asset data from a CSV record.
+            ref_date (datetime, optional): The date future installs are checked against. Defaults to now.
+        Returns:
+            AssetValidator: An AssetValidator object created from the CSV record.
+        Raises:
+            ValueError: If the CSV record contains invalid data.
+        """
+        cls.validate(csv_record, ref_date)
+        return cls(*cls.intern_fields(csv_record))
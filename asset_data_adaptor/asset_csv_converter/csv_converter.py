@@ -1,10 +1,18 @@
 """Contains the CsvValidator Class that converts a CSV file into JSON objects whilst 
 utilising AssetValidator to validate the data. 
 
-A Log file is created for auditing purposes. If un-needed then remove Lines 17-33
+A Log file is created for auditing purposes. If un-needed then remove the section from
+"# Ensure the 'logs' directory exists" through "# Add the handlers to the logger",
+keeping only the stream handler.
 """
 from .asset_validator import AssetValidator as AV
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+import csv
+import json
 import logging
+import logging.handlers
 import os
 
 # Ensure the 'logs' directory exists
@@ -27,10 +35,42 @@ stream_logger.setLevel(logging.INFO)
 formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 file_logger.setFormatter(formatter)
 
+# Buffer file writes so each invalid record isn't written to disk individually.
+# Flushed after each processed CSV file, when full, or on exit.
+buffered_file_logger = logging.handlers.MemoryHandler(
+    capacity=10_000, flushLevel=logging.CRITICAL, target=file_logger
+)
+
 # Add the handlers to the logger
-logger.addHandler(file_logger)
+logger.addHandler(buffered_file_logger)
 logger.addHandler(stream_logger)
 
+# Expected CSV column headers, in order. Also the keys of the JSON records.
+EXPECTED_HEADERS = (
+    "ID",
+    "TYPE",
+    "TYPE_DESC",
+    "INSTALL_DATE",
+    "EASTING",
+    "NORTHING",
+    "LOCATION",
+    "CELL",
+    "SIGNAL_GROUP",
+    "STATUS",
+    "INSTALL_ENGINEER",
+)
+
+
+def open_csv_file(file_path: str):
+    """Opens a CSV file for reading by CsvConverter.process_csv_file.
+
+    Args:
+        file_path (str): The path to the CSV file.
+    Returns:
+        file object: The CSV file opened in text mode, as the csv module expects.
+    """
+    return open(file_path, "r", encoding="utf-8", newline="")
+
 
 class CsvConverter:
     """Converts asset data from a TFL Asset CSV file to JSON format 
@@ -41,9 +81,10 @@ class CsvConverter:
     and calculates the bounding box of asset coordinates.
 
     Attributes:
-        valid_assets (list): List to store valid Asset objects.
-        invalid_assets (list): List to store invalid CSV records.
-        bounding_box (dict): Bounding box of asset coordinates.
+        invalid_assets (list): List to store invalid CSV records, unless streamed to invalid_records_path.
+        invalid_records_path (str): Optional CSV file path that invalid records are streamed to.
+        invalid_count (int): Number of invalid CSV records.
+        bounding_box (dict): Bounding box of asset coordinates, as integers.
         json_data (list): List for JSON records.
     """
 
@@ -56,109 +97,151 @@ class CsvConverter:
         Returns:
             dict: A dictionary containing the Asset object's data.
         """
-        return {
-            "ID": asset.asset_id,
-            "TYPE": asset.asset_type,
-            "TYPE_DESC": asset.type_description,
-            "INSTALL_DATE": asset.install_date,
-            "EASTING": int(asset.easting),
-            "NORTHING": int(asset.northing),
-            "LOCATION": asset.location,
-            "CELL": asset.cell,
-            "SIGNAL_GROUP": asset.signal_group,
-            "STATUS": asset.status,
-            "INSTALL_ENGINEER": asset.install_engineer,
-        }
-
-    def __init__(self):
-        """Initializes a CsvConverter object."""
-        self.valid_assets = []  # List to store valid Asset objects
+        # AssetValidator's slots are in CSV record order.
+        return CsvConverter.record_to_json(
+            [getattr(asset, field) for field in AV.__slots__]
+        )
+
+    @staticmethod
+    def record_to_json(csv_record: list) -> dict:
+        """Converts a validated CSV record straight to a JSON-compatible dictionary,
+        without constructing an intermediate Asset object.
+
+        Args:
+            csv_record (list): A CSV record that has passed AssetValidator.validate.
+        Returns:
+            dict: A dictionary containing the CSV record's data, keyed by the CSV headers.
+        """
+        record_json = dict(zip(EXPECTED_HEADERS, csv_record))
+        record_json["EASTING"] = int(record_json["EASTING"])
+        record_json["NORTHING"] = int(record_json["NORTHING"])
+        return record_json
+
+    def __init__(self, invalid_records_path: str = None):
+        """Initializes a CsvConverter object.
+
+        Args:
+            invalid_records_path (str, optional): If given, invalid CSV records are written to this
+                CSV file as they are found rather than held in memory. The file is started afresh by this
+                CsvConverter and appended to by each processed file, like invalid_assets.
+        """
+        self.invalid_records_path = invalid_records_path
+        self._invalid_records_started = False  # Whether invalid_records_path has been written yet
         self.invalid_assets = []  # List to store invalid CSV records
+        self.invalid_count = 0  # Count of invalid CSV records
         self.bounding_box = None  # Bounding box of asset coordinates
+        self._eastings = array("i")  # Integer coordinates of valid assets
+        self._northings = array("i")
         self.json_data = []  # List for JSON records.
 
-    def process_csv_file(self, file_path: str) -> tuple:
+    @contextmanager
+    def _invalid_record_writer(self):
+        """Provides the function that stores an invalid CSV record.
+
+        Yields:
+            function: Appends to invalid_assets, or writes a row to invalid_records_path if set.
+        """
+        if self.invalid_records_path is None:
+            yield self.invalid_assets.append
+            return
+        # Truncated and given headers on first use, then appended to for later files.
+        mode = "a" if self._invalid_records_started else "w"
+        with open(
+            self.invalid_records_path, mode, encoding="utf-8", newline=""
+        ) as invalid_file:
+            writer = csv.writer(invalid_file)
+            if not self._invalid_records_started:
+                writer.writerow(EXPECTED_HEADERS)
+                self._invalid_records_started = True
+            yield writer.writerow
+
+    def process_csv_file(self, file_path: str, opener=open_csv_file) -> tuple:
         """
         Reads and processes asset data from a CSV file.
 
         Args:
             file_path (str): The path to the CSV file.
+            opener (function, optional): Called with file_path to open the CSV file. Defaults to open_csv_file.
         Returns:
             tuple: A tuple containing valid asset data in JSON format, bounding box coordinates, 
             and a list of invalid CSV records that weren't processed.
+            The list is left empty when invalid records are streamed to invalid_records_path.
         Raises:
             TypeError: If the input file is not a CSV file.
             ValueError: If the CSV file headers are incorrect.
         """
         count = 0
+        invalid_count = 0
         # CSV Check
-        if file_path.split(".")[-1] != "csv":
+        if not file_path.lower().endswith(".csv"):
             raise TypeError("Input file is not a CSV")
 
-        header_line = None  # Variable to store the header line
-        with open(file_path, "r", encoding="utf-8") as csv_file:
-            # Validate columns names against expected headers and process.
-            for line_number, line in enumerate(csv_file):
-                if line_number == 0:  # First line, assumed to be headers.
-                    header_line = line.strip().split(
-                        ","
-                    )  # Relies on ',' deliminated. Check deliminater in file if ValueError raised.
-                    expected_headers = [
-                        "ID",
-                        "TYPE",
-                        "TYPE_DESC",
-                        "INSTALL_DATE",
-                        "EASTING",
-                        "NORTHING",
-                        "LOCATION",
-                        "CELL",
-                        "SIGNAL_GROUP",
-                        "STATUS",
-                        "INSTALL_ENGINEER",
-                    ]
-                    if header_line != expected_headers:
-                        logger.error(
-                            f"CSV headers are '{header_line}'"
-                        )  # Log failed headers.
-                        raise ValueError("Error: Incorrect headers in the CSV file.")
-                else:
-                    csv_record = line.strip().split(",")
-                    count += 1
-                    try:
-                        asset = AV.from_csv_record(csv_record)
-                        self.valid_assets.append(asset)
-                    except Exception as e:
-                        # Log invalid records.
-                        # Add to a list of invalid records for future interrogation.
-                        logger.error(f"Invalid record {csv_record[0]}: {e}")
-                        self.invalid_assets.append( 
-                            csv_record
-                        ) # Embedded list for visual clarity.
-                        pass
+        ref_date = datetime.now()  # Single reference date for every record in the file.
+        # Bound once so the per-row loop avoids repeated attribute lookups.
+        validate = AV.validate
+        intern_fields = AV.intern_fields
+        record_to_json = CsvConverter.record_to_json
+        add_json = self.json_data.append
+        add_easting = self._eastings.append
+        add_northing = self._northings.append
+        # Audit entries are flushed to the log file however processing ends.
+        try:
+            with opener(file_path) as csv_file:
+                # Relies on ',' deliminated. Check deliminater in file if ValueError raised.
+                reader = csv.reader(csv_file)
+                # First line, assumed to be headers. Validate columns names against expected headers.
+                header_line = next(reader, [])
+                if tuple(header_line) != EXPECTED_HEADERS:
+                    logger.error(f"CSV headers are '{header_line}'")  # Log failed headers.
+                    raise ValueError("Error: Incorrect headers in the CSV file.")
+                # Process the remaining records.
+                with self._invalid_record_writer() as add_invalid:
+                    for csv_record in reader:
+                        if not csv_record:  # Blank lines are skipped.
+                            continue
+                        count += 1
+                        try:
+                            validate(csv_record, ref_date)
+                            # Valid records go straight to JSON and the coordinate buffers in one pass.
+                            record_json = record_to_json(intern_fields(csv_record))
+                            add_json(record_json)
+                            add_easting(record_json["EASTING"])
+                            add_northing(record_json["NORTHING"])
+                        except Exception as e:
+                            # Log invalid records.
+                            # Add to invalid records for future interrogation.
+                            logger.error(f"Invalid record {csv_record[0]}: {e}")
+                            add_invalid(csv_record)  # Embedded list for visual clarity.
+                            invalid_count += 1
+        finally:
+            buffered_file_logger.flush()
+        self.invalid_count += invalid_count
 
         logger.info(
-            f"{count} assets processed. Of which, {len(self.invalid_assets)} are invalid. Please check logs for further information."
+            f"{count} assets processed. Of which, {invalid_count} are invalid. Please check logs for further information."
         )
         logger.info("")  # Added for clarity. Remove depending on processing frequency.
         logger.info(
             "-----------------------------------------------------------------------------"
         )
         logger.info("")
+        buffered_file_logger.flush()  # Write the summary entries to the log file.
 
-        # Calculate bounding box
-        if self.valid_assets:
-            northings = [(asset.northing) for asset in self.valid_assets]
-            eastings = [(asset.easting) for asset in self.valid_assets]
+        # Calculate bounding box. Integer comparison, as strings would mis-order "99999" and "100000".
+        if self.json_data:
             self.bounding_box = {
-                "min_northing": min(northings),
-                "max_northing": max(northings),
-                "min_easting": min(eastings),
-                "max_easting": max(eastings),
+                "min_northing": min(self._northings),
+                "max_northing": max(self._northings),
+                "min_easting": min(self._eastings),
+                "max_easting": max(self._eastings),
             }
 
-        # Convert valid assets to JSON format
-        self.json_data = [
-            CsvConverter.asset_to_json(asset) for asset in self.valid_assets
-        ]
-
         return self.json_data, self.bounding_box, self.invalid_assets
+
+    def to_json(self) -> str:
+        """Serialises the valid asset records to JSON text in a single call.
+
+        Returns:
+            str: A compact JSON array of the valid asset records.
+        """
+        return json.dumps(self.json_data, separators=(",", ":"))
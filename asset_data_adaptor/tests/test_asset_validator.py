@@ -9,18 +9,24 @@ Methods:
     test_valid_asset_type: Test case to validate the validation of a valid asset type and type description.
     test_valid_status: Test case to validate the validation of a valid asset status.
     test_valid_install_date: Test case to validate the validation of a valid installation date.
+    test_install_date_ref_date: Test case to validate the installation date against a given reference date.
+    test_parse_ddmonyyyy: Test case to validate the parsing of 'dd-Mon-yyyy' date strings.
     test_valid_easting: Test case to validate the validation of a valid easting value.
     test_valid_northing: Test case to validate the validation of a valid northing value.
     test_valid_location: Test case to validate the validation of a valid location.
     test_valid_cell: Test case to validate the validation of a valid cell value.
     test_valid_signal_group: Test case to validate the validation of a valid signal group.
     test_valid_engineer: Test case to validate the validation of a valid engineer name.
+    test_validate: Test case to validate the validation of a CSV record without object creation.
+    test_intern_fields: Test case to validate interning of the low-cardinality fields of a CSV record.
     test_valid_csv_record: Test case to validate the conversion of a valid CSV record to AssetValidator object.
     test_invalid_csv_record: Test case to validate handling of invalid CSV records.
 """
 
 import unittest
+from datetime import datetime
 from ..asset_csv_converter.asset_validator import AssetValidator as AV
+from ..asset_csv_converter.asset_validator import _parse_ddmonyyyy
 
 
 class TestAsset(unittest.TestCase):
@@ -125,16 +131,41 @@ class TestAsset(unittest.TestCase):
             AV._validate_install_date("", "Active")  # Invalid format
             AV._validate_install_date("32-Jan-2026", "Inactive")  # Invalid future date
 
+    def test_install_date_ref_date(self):
+        """
+        Test case to validate the installation date against a given reference date.
+        """
+        ref_date = datetime(2023, 4, 10)
+        self.assertTrue(AV._validate_install_date("10-Apr-2023", "Active", ref_date))
+        self.assertTrue(AV._validate_install_date("11-Apr-2023", "Proposed", ref_date))
+        with self.assertRaises(ValueError):
+            AV._validate_install_date("11-Apr-2023", "Active", ref_date)
+
+    def test_parse_ddmonyyyy(self):
+        """
+        Test case to validate the parsing of 'dd-Mon-yyyy' date strings.
+        """
+        # Positive scenarios
+        self.assertEqual(_parse_ddmonyyyy("04-Mar-2007"), datetime(2007, 3, 4))
+        self.assertEqual(_parse_ddmonyyyy("4-mar-2007"), datetime(2007, 3, 4))
+        # Invalid formats/Negative Scenario
+        invalid_dates = ["32-Jan-2023", "29-Feb-2023", "10-pr-2023", "1-Jan-99", ""]
+        TestAsset.assert_error_cases(self, _parse_ddmonyyyy, invalid_dates)
+
     def test_valid_easting(self):
         """
         Test case to validate the validation of a valid easting value.
         """
         # Positive scenario
         self.assertTrue(AV._validate_easting("531695"))
+        self.assertTrue(AV._validate_easting("500442"))  # Range boundary
+        self.assertTrue(AV._validate_easting("538216"))  # Range boundary
         # Invalid formats/Negative Scenario
         with self.assertRaises(ValueError):
             AV._validate_easting("Invalid")  # Invalid format
             AV._validate_easting("123456")  # Invalid range
+        invalid_eastings = ["123456", "500441", "538217", "561633"]
+        TestAsset.assert_error_cases(self, AV._validate_easting, invalid_eastings)
 
     def test_valid_northing(self):
         """
@@ -142,10 +173,14 @@ class TestAsset(unittest.TestCase):
         """
         # Positive scenario
         self.assertTrue(AV._validate_northing("181465"))
+        self.assertTrue(AV._validate_northing("148012"))  # Range boundary
+        self.assertTrue(AV._validate_northing("205415"))  # Range boundary
         # Invalid formats/Negative Scenario
         with self.assertRaises(ValueError):
             AV._validate_northing("Invalid")  # Invalid format
             AV._validate_northing("654321")  # Invalid range
+        invalid_northings = ["654321", "148011", "205416"]
+        TestAsset.assert_error_cases(self, AV._validate_northing, invalid_northings)
 
     def test_valid_location(self):
         """
@@ -195,6 +230,30 @@ class TestAsset(unittest.TestCase):
         with self.assertRaises(ValueError):
             AV._validate_engineer("")  # Empty engineer name
 
+    def test_validate(self):
+        """
+        Test case to validate the validation of a CSV record without object creation.
+        """
+        self.assertTrue(AV.validate(TestAsset.VALID_CSV_RECORD))
+        with self.assertRaises(ValueError):
+            AV.validate(TestAsset.VALID_CSV_RECORD[:-1])  # Missing field
+
+    def test_intern_fields(self):
+        """
+        Test case to validate interning of the low-cardinality fields of a CSV record.
+        """
+        # Two records with equal values held in distinct string objects, as separate CSV rows would be.
+        first_record = [value.encode().decode() for value in TestAsset.VALID_CSV_RECORD]
+        second_record = [value.encode().decode() for value in TestAsset.VALID_CSV_RECORD]
+        first_interned = AV.intern_fields(first_record)
+        second_interned = AV.intern_fields(second_record)
+
+        self.assertEqual(first_interned, list(TestAsset.VALID_CSV_RECORD))
+        for index in (1, 2, 7, 9):
+            with self.subTest(index=index):
+                self.assertIsNot(first_record[index], second_record[index])
+                self.assertIs(first_interned[index], second_interned[index])
+
     def test_valid_csv_record(self):
         """
         Test case to validate the conversion of a valid CSV record to AssetValidator object.
@@ -3,20 +3,85 @@ This module contains unit tests for the CsvConverter class and its associated me
 
 The CsvConverter class is responsible for processing CSV files containing asset data and converting it to JSON format.
 
+Functions:
+    fake_opener: Builds an in-memory CSV file opener to pass to CsvConverter.process_csv_file.
 Classes:
     TestCsvConverter(unittest.TestCase): A class containing unit tests for the CsvConverter class.
 Methods:
     test_asset_to_json: Test case to validate the conversion of AssetValidator objects to JSON format.
-    test_process_csv_file_valid: Test case to validate the processing of a valid CSV file.
-    test_process_csv_file_invalid: Test case to validate the processing of an invalid CSV file.
+    test_record_to_json: Test case to validate the conversion of CSV records to JSON format.
+    test_process_csv_file_cases: Test case to validate the processing of valid, invalid, quoted field,
+        incorrect header and empty CSV files.
+    test_process_csv_file_invalid_records_path: Test case to validate streaming invalid records to a CSV file.
+    test_to_json: Test case to validate serialising processed records to JSON text.
+    test_process_csv_file_read_error_flushes_log: Test case to validate audit entries are written when reading fails.
     test_process_csv_file_non_csv_file: Test case to validate handling non-CSV files.
-    test_process_csv_file_incorrect_headers: Test case to validate handling incorrect CSV headers.
 """
 
+import csv
+import io
+import json
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from types import MappingProxyType
 from ..asset_csv_converter.asset_validator import AssetValidator as AV
-from ..asset_csv_converter.csv_converter import CsvConverter
+from ..asset_csv_converter.csv_converter import CsvConverter, buffered_file_logger
+
+
+# CSV file lines shared by the tests.
+HEADER_LINE = "ID,TYPE,TYPE_DESC,INSTALL_DATE,EASTING,NORTHING,LOCATION,CELL,SIGNAL_GROUP,STATUS,INSTALL_ENGINEER"
+VALID_LINE = "12/345678,DC,Dual Toucan,10-Apr-2023,531695,181465,Valid Location,NORT,R801,Active,Valid Engineer"
+INVALID_LINE = "12/34567,D,Dual Toucan,10-pr-2023,53195,18165,Valid Location,NORT,R801,Active,Valid Engineer"
+
+# Immutable expected values, so no test can alter them for another.
+VALID_CSV_RECORD = (
+    "12/345678",
+    "DC",
+    "Dual Toucan",
+    "10-Apr-2023",
+    "531695",
+    "181465",
+    "Valid Location",
+    "NORT",
+    "R801",
+    "Active",
+    "Valid Engineer",
+)
+_EXPECTED_JSON = {
+    "ID": "12/345678",
+    "TYPE": "DC",
+    "TYPE_DESC": "Dual Toucan",
+    "INSTALL_DATE": "10-Apr-2023",
+    "EASTING": 531695,
+    "NORTHING": 181465,
+    "LOCATION": "Valid Location",
+    "CELL": "NORT",
+    "SIGNAL_GROUP": "R801",
+    "STATUS": "Active",
+    "INSTALL_ENGINEER": "Valid Engineer",
+}
+EXPECTED_JSON = MappingProxyType(_EXPECTED_JSON)
+EXPECTED_BOUNDING_BOX = MappingProxyType(
+    {
+        "min_northing": EXPECTED_JSON["NORTHING"],
+        "max_northing": EXPECTED_JSON["NORTHING"],
+        "min_easting": EXPECTED_JSON["EASTING"],
+        "max_easting": EXPECTED_JSON["EASTING"],
+    }
+)
+
+
+def fake_opener(lines: list):
+    """
+    Builds an opener for CsvConverter.process_csv_file that reads the given lines from memory.
+
+    Args:
+        lines (list): The lines of the CSV file.
+    Returns:
+        function: An opener returning an in-memory file for any path.
+    """
+    return lambda file_path: io.StringIO("".join(line + "\n" for line in lines))
 
 
 class TestCsvConverter(unittest.TestCase):
@@ -24,142 +89,160 @@ class TestCsvConverter(unittest.TestCase):
     Unit tests for the CsvConverter class.
     """
 
-    def setUp(self):
-        """
-        Set up a CsvConverter instance for testing.
-        """
-        self.converter = CsvConverter()
-
-    VALID_CSV_RECORD = (
-        "12/345678",
-        "DC",
-        "Dual Toucan",
-        "10-Apr-2023",
-        "531695",
-        "181465",
-        "Valid Location",
-        "NORT",
-        "R801",
-        "Active",
-        "Valid Engineer",
-    )
-    EXPECTED_JSON = {
-        "ID": "12/345678",
-        "TYPE": "DC",
-        "TYPE_DESC": "Dual Toucan",
-        "INSTALL_DATE": "10-Apr-2023",
-        "EASTING": 531695,
-        "NORTHING": 181465,
-        "LOCATION": "Valid Location",
-        "CELL": "NORT",
-        "SIGNAL_GROUP": "R801",
-        "STATUS": "Active",
-        "INSTALL_ENGINEER": "Valid Engineer",
-    }
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up a CsvConverter instance shared by the tests that don't process a file.
+        Tests that process a file create their own, as a CsvConverter accumulates results.
+        """
+        cls.converter = CsvConverter()
 
     def test_asset_to_json(self):
         """
         Test case to validate the conversion of AssetValidator objects to JSON format.
         """
-        asset = AV(
-            asset_id="12/345678",
-            asset_type="DC",
-            type_description="Dual Toucan",
-            install_date="10-Apr-2023",
-            easting="531695",
-            northing="181465",
-            location="Valid Location",
-            cell="NORT",
-            signal_group="R801",
-            status="Active",
-            install_engineer="Valid Engineer",
-        )
+        asset = AV(*VALID_CSV_RECORD)
 
         self.assertEqual(
-            CsvConverter.asset_to_json(asset), TestCsvConverter.EXPECTED_JSON
+            CsvConverter.asset_to_json(asset), EXPECTED_JSON
         )
 
-    @patch("builtins.open", create=True)
-    def test_process_csv_file_valid(self, mock_open):
+    def test_record_to_json(self):
         """
-        Test case to validate the processing of a valid CSV file.
+        Test case to validate the conversion of CSV records to JSON format.
         """
-        mock_file = mock_open.return_value
-        mock_file.__enter__.return_value = [
-            "ID,TYPE,TYPE_DESC,INSTALL_DATE,EASTING,NORTHING,LOCATION,CELL,SIGNAL_GROUP,STATUS,INSTALL_ENGINEER",
-            "12/345678,DC,Dual Toucan,10-Apr-2023,531695,181465,Valid Location,NORT,R801,Active,Valid Engineer",
-        ]
-
-        json_data, bounding_box, invalid_assets = self.converter.process_csv_file(
-            "test.csv"
+        self.assertEqual(
+            CsvConverter.record_to_json(VALID_CSV_RECORD),
+            EXPECTED_JSON,
         )
 
-        expected_json_data = [TestCsvConverter.EXPECTED_JSON]
+    def test_process_csv_file_cases(self):
+        """
+        Test case to validate the processing of valid, invalid, quoted field, incorrect header and empty CSV files.
+        """
+        # (name, file lines, expected (json_data, bounding_box, invalid_assets), expected exception)
+        cases = (
+            (
+                "valid",
+                [HEADER_LINE, VALID_LINE],
+                ([EXPECTED_JSON], EXPECTED_BOUNDING_BOX, []),
+                None,
+            ),
+            (
+                "invalid",
+                [HEADER_LINE, INVALID_LINE],
+                (
+                    [],
+                    None,
+                    [
+                        [
+                            "12/34567",
+                            "D",
+                            "Dual Toucan",
+                            "10-pr-2023",
+                            "53195",
+                            "18165",
+                            "Valid Location",
+                            "NORT",
+                            "R801",
+                            "Active",
+                            "Valid Engineer",
+                        ]
+                    ],
+                ),
+                None,
+            ),
+            (
+                "quoted_field",
+                [
+                    HEADER_LINE,
+                    '12/345678,DC,Dual Toucan,10-Apr-2023,531695,181465,"Valid, Location",NORT,R801,Active,Valid Engineer',
+                ],
+                (
+                    [{**EXPECTED_JSON, "LOCATION": "Valid, Location"}],
+                    EXPECTED_BOUNDING_BOX,
+                    [],
+                ),
+                None,
+            ),
+            ("incorrect_headers", ["ID,TYPE,INCORRECT_HEADER", "1,Type,Value"], None, ValueError),
+            ("empty_file", [], None, ValueError),
+        )
 
-        expected_bounding_box = {
-            "min_northing": f"{TestCsvConverter.EXPECTED_JSON['NORTHING']}",
-            "max_northing": f"{TestCsvConverter.EXPECTED_JSON['NORTHING']}",
-            "min_easting": f"{TestCsvConverter.EXPECTED_JSON['EASTING']}",
-            "max_easting": f"{TestCsvConverter.EXPECTED_JSON['EASTING']}",
-        }
+        for name, lines, expected, expected_exc in cases:
+            with self.subTest(name=name):
+                converter = CsvConverter()
+                opener = fake_opener(lines)
+                if expected_exc is not None:
+                    with self.assertRaises(expected_exc):
+                        converter.process_csv_file("test.csv", opener=opener)
+                    continue
 
-        self.assertEqual(json_data, expected_json_data)
-        self.assertEqual(bounding_box, expected_bounding_box)
-        self.assertEqual(invalid_assets, [])
+                self.assertEqual(
+                    converter.process_csv_file("test.csv", opener=opener), expected
+                )
 
-    @patch("builtins.open", create=True)
-    def test_process_csv_file_invalid(self, mock_open):
+    def test_process_csv_file_invalid_records_path(self):
+        """
+        Test case to validate streaming invalid records to a CSV file.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, "test.csv")
+            invalid_path = os.path.join(temp_dir, "invalid.csv")
+            with open(input_path, "w", encoding="utf-8", newline="") as input_file:
+                input_file.write(f"{HEADER_LINE}\n{VALID_LINE}\n{INVALID_LINE}\n")
+
+            converter = CsvConverter(invalid_records_path=invalid_path)
+            json_data, _, invalid_assets = converter.process_csv_file(input_path)
+            self.assertEqual(json_data, [EXPECTED_JSON])
+            self.assertEqual(invalid_assets, [])
+
+            with open(invalid_path, encoding="utf-8", newline="") as invalid_file:
+                invalid_rows = list(csv.reader(invalid_file))
+
+            # A second file appends to the same invalid records file.
+            converter.process_csv_file(input_path)
+            with open(invalid_path, encoding="utf-8", newline="") as invalid_file:
+                accumulated_rows = list(csv.reader(invalid_file))
+
+        self.assertEqual(invalid_rows[1][0], "12/34567")
+        self.assertEqual(len(invalid_rows), 2)  # Headers plus the invalid record
+        self.assertEqual(converter.invalid_count, 2)
+        self.assertEqual(accumulated_rows, invalid_rows + invalid_rows[1:])
+
+    def test_to_json(self):
         """
-        Test case to validate the processing of an invalid CSV file.
+        Test case to validate serialising processed records to JSON text.
         """
-        mock_file = mock_open.return_value
-        mock_file.__enter__.return_value = [
-            "ID,TYPE,TYPE_DESC,INSTALL_DATE,EASTING,NORTHING,LOCATION,CELL,SIGNAL_GROUP,STATUS,INSTALL_ENGINEER",
-            "12/34567,D,Dual Toucan,10-pr-2023,53195,18165,Valid Location,NORT,R801,Active,Valid Engineer",
-        ]
+        opener = fake_opener([HEADER_LINE, VALID_LINE])
+        converter = CsvConverter()
+        converter.process_csv_file("test.csv", opener=opener)
 
-        json_data, bounding_box, invalid_assets = self.converter.process_csv_file(
-            "test.csv"
-        )
+        self.assertEqual(json.loads(converter.to_json()), [EXPECTED_JSON])
 
-        self.assertEqual(json_data, [])
-        self.assertEqual(bounding_box, None)
-        self.assertEqual(
-            invalid_assets,
-            [
-                [
-                    "12/34567",
-                    "D",
-                    "Dual Toucan",
-                    "10-pr-2023",
-                    "53195",
-                    "18165",
-                    "Valid Location",
-                    "NORT",
-                    "R801",
-                    "Active",
-                    "Valid Engineer",
-                ]
-            ],
-        )
-
-    def test_process_csv_file_non_csv_file(self):
+    def test_process_csv_file_read_error_flushes_log(self):
         """
-        Test case to validate handling non-CSV files.
+        Test case to validate audit entries are written when reading fails.
         """
-        with self.assertRaises(TypeError):
-            self.converter.process_csv_file("test.txt")
+        oversized_line = "x" * (csv.field_size_limit() + 1)  # Raises csv.Error when read
+        opener = fake_opener([HEADER_LINE, INVALID_LINE, oversized_line])
 
-    @patch("builtins.open")
-    def test_process_csv_file_incorrect_headers(self, mock_open):
+        with self.assertRaises(csv.Error):
+            CsvConverter().process_csv_file("test.csv", opener=opener)
+        self.assertEqual(buffered_file_logger.buffer, [])
+
+    def test_process_csv_file_non_csv_file(self):
         """
-        Test case to validate handling incorrect CSV headers.
+        Test case to validate handling non-CSV files. The file must be rejected before it is opened.
         """
-        mock_file = mock_open.return_value
-        mock_file.__enter__.return_value = ["ID,TYPE,INCORRECT_HEADER\n1,Type,Value"]
 
-        with self.assertRaises(ValueError):
-            self.converter.process_csv_file("test.csv")
+        def failing_opener(file_path):
+            raise AssertionError(f"opener should not be called for non-csv '{file_path}'")
+
+        for file_path in ("test.txt", "csv", "test.csv.txt"):
+            with self.subTest(file_path=file_path):
+                with self.assertRaises(TypeError):
+                    self.converter.process_csv_file(file_path, opener=failing_opener)
 
 
 if __name__ == "__main__":